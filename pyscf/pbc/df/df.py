@@ -547,17 +547,22 @@ class GDF(aft.AFTDF):
         if self.kpts_band is None:
             kband_uniq = numpy.zeros((0,3))
         else:
-            kband_uniq = [k for k in self.kpts_band if len(member(k, kpts))==0]
+            dk = abs(self.kpts_band[:,None,:] - kpts).sum(axis=2)
+            kband_uniq = self.kpts_band[~(dk < KPT_DIFF_TOL).any(axis=1)]
         if j_only is None:
             j_only = self._j_only
         if j_only:
             kall = numpy.vstack([kpts,kband_uniq])
             kptij_lst = numpy.hstack((kall,kall)).reshape(-1,2,3)
         else:
-            kptij_lst = [(ki, kpts[j]) for i, ki in enumerate(kpts) for j in range(i+1)]
-            kptij_lst.extend([(ki, kj) for ki in kband_uniq for kj in kpts])
-            kptij_lst.extend([(ki, ki) for ki in kband_uniq])
-            kptij_lst = numpy.asarray(kptij_lst)
+            nkpts = len(kpts)
+            nband = len(kband_uniq)
+            i, j = numpy.tril_indices(nkpts)
+            kptij_lst = numpy.vstack((
+                numpy.hstack((kpts[i], kpts[j])),
+                numpy.hstack((numpy.repeat(kband_uniq, nkpts, axis=0),
+                              numpy.tile(kpts, (nband,1)))),
+                numpy.hstack((kband_uniq, kband_uniq)))).reshape(-1,2,3)
 
         if with_j3c:
             if isinstance(self._cderi_to_save, str):
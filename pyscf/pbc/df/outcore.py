@@ -237,14 +237,13 @@ def _aux_e2(cell, auxcell_or_auxbasis, erifile, intor='int3c2e', aosym='s2ij', c
     kptis = kptij_lst[:,0]
     kptjs = kptij_lst[:,1]
     kpt_ji = kptjs - kptis
-    uniq_kpts, uniq_index, uniq_inverse = unique(kpt_ji)
+    uniq_inverse = unique(kpt_ji)[2]
     # sorted_ij_idx: Sort and group the kptij_lst according to the ordering in
     # df._make_j3c to reduce the data fragment in the hdf5 file.  When datasets
     # are written to hdf5, they are saved sequentially. If the integral data are
     # saved as the order of kptij_lst, removing the datasets in df._make_j3c will
     # lead to disk space fragment that can not be reused.
-    sorted_ij_idx = numpy.hstack([numpy.where(uniq_inverse == k)[0]
-                                  for k, kpt in enumerate(uniq_kpts)])
+    sorted_ij_idx = numpy.argsort(uniq_inverse, kind='mergesort')
     tril_idx = numpy.tril_indices(ni)
     tril_idx = tril_idx[0] * ni + tril_idx[1]
 